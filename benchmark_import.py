@@ -0,0 +1,86 @@
+"""
+导入耗时基准：基于 ``python -X importtime`` 统计模块的冷启动导入开销。
+
+用法：
+    python benchmark_import.py                      # 检查 generator_core，默认预算 80ms
+    python benchmark_import.py mybatis_generator --budget-ms 120
+
+超出预算或导入了禁止的重依赖时以非 0 退出码结束，可直接用于回归检查；
+也可以在测试中调用 check_import_budget() 拿到结果自行断言。
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+# 核心模块冷启动时不允许出现的重依赖，它们应在首次使用时才导入
+HEAVY_MODULES = ("pymysql", "jinja2", "dataclasses_json", "tkinter", "_tkinter", "zipfile")
+
+DEFAULT_BUDGET_MS = 80.0
+
+# import time: self [us] | cumulative | imported package
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def measure_import(module, repeat=5):
+    """
+    在干净的子进程中导入模块，返回 (最小累计耗时 ms, 本次导入涉及的模块名列表)
+    :param module: 待导入的模块名
+    :param repeat: 重复次数，取最小值以降低抖动
+    """
+    cwd = os.path.dirname(os.path.abspath(__file__))
+    best_us = None
+    imported = []
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=cwd, capture_output=True, text=True
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"导入 {module} 失败:\n{proc.stderr}")
+        total_us = None
+        names = []
+        for line in proc.stderr.splitlines():
+            match = _IMPORTTIME_LINE.match(line)
+            if not match:
+                continue
+            name = match.group(4)
+            names.append(name)
+            # 目标模块最后完成导入，其累计耗时即为整体开销
+            if name == module:
+                total_us = int(match.group(2))
+        if total_us is None:
+            raise RuntimeError(f"未在 importtime 输出中找到 {module}")
+        if best_us is None or total_us < best_us:
+            best_us = total_us
+            imported = names
+    return best_us / 1000.0, imported
+
+
+def check_import_budget(module="generator_core", budget_ms=DEFAULT_BUDGET_MS, forbidden=HEAVY_MODULES, repeat=5):
+    """
+    检查模块导入是否在预算内且未加载禁止的依赖
+    :return: (是否通过, 耗时 ms, 违规导入的模块列表)
+    """
+    elapsed_ms, imported = measure_import(module, repeat)
+    violations = sorted({name for name in imported if name.split(".")[0] in forbidden})
+    return elapsed_ms <= budget_ms and not violations, elapsed_ms, violations
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="模块导入耗时基准")
+    parser.add_argument("module", nargs="?", default="generator_core")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    ok, elapsed_ms, violations = check_import_budget(args.module, args.budget_ms, repeat=args.repeat)
+    print(f"{args.module}: {elapsed_ms:.1f}ms (预算 {args.budget_ms:.1f}ms)")
+    if violations:
+        print(f"不应在导入时加载: {', '.join(violations)}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
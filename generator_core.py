@@ -0,0 +1,442 @@
+"""
+轻量核心模块：配置、类型映射、模板渲染。
+
+本模块只依赖标准库，jinja2 / pymysql / zipfile 等较重的依赖在首次使用时才导入，
+保证 GUI 启动或仅加载配置时不需要付出这些库的导入开销。
+"""
+from enum import Enum
+import os
+import json
+import re
+import sys
+import time
+from dataclasses import dataclass, field, asdict
+from pathlib import Path, PurePosixPath, PureWindowsPath
+from string import Formatter
+from typing import Optional
+
+# 默认类型映射配置
+DEFAULT_TYPE_MAP = {
+    "INT": "Integer",
+    "BIGINT": "Long",
+    "CHAR": "String",
+    "VARCHAR": "String",
+    "DATE": "Date",
+    "TIME": "Date",
+    "DATETIME": "Date",
+    "TIMESTAMP": "Date",
+    "DECIMAL": "BigDecimal",
+    "FLOAT": "Float",
+    "DOUBLE": "Double",
+    "TINYINT(1)": "Boolean",
+    "TEXT": "String"
+}
+
+# 默认模板清单，每项含义见 TemplateEntry
+DEFAULT_TEMPLATES = [
+    {"template": "Entity.java.j2", "output": "java/{entity_path}/{entity_name}.java"},
+    {"template": "Dao.java.j2", "output": "java/{dao_path}/{entity_name}Mapper.java"},
+    {"template": "Mapper.xml.j2", "output": "resources/{xml_path}/{entity_name}Mapper.xml"},
+]
+
+config_cache_path = "./simple_mybatis_generator/config.json"
+
+
+def zip_folder(folder_path, output_zip):
+    """
+    压缩文件夹为 ZIP 文件
+    :param folder_path: 待压缩的文件夹路径
+    :param output_zip: 输出的 ZIP 文件路径
+    """
+    # 仅在打包输出时才需要 zipfile（会连带导入压缩库），延迟到此处导入
+    import zipfile
+
+    with zipfile.ZipFile(output_zip, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        for root, _, files in os.walk(folder_path):
+            for file in files:
+                file_path = os.path.join(root, file)
+                # 计算压缩包内的相对路径（保留目录结构）
+                arcname = os.path.relpath(file_path, folder_path)
+                zipf.write(file_path, arcname)
+    print(f"已压缩: {folder_path} -> {output_zip}")
+
+
+def big_camel_case_filter(s):
+    if len(s) > 1:
+        s = camel_case_filter(s)
+        return f"{str(s[0]).upper()}{s[1:]}"
+    elif len(s) == 1:
+        return str(s).upper()
+    else:
+        return s
+
+
+def camel_case_filter(s):
+    """安全的下划线转驼峰过滤器"""
+    try:
+        if not s or not isinstance(s, str):
+            return s
+        # 分割并过滤空段
+        parts = [word for word in re.split(r'_+', s.strip()) if word]
+        if not parts:
+            return s
+        # 首字母小写 + 后续单词首字母大写
+        return parts[0].lower() + ''.join(word.capitalize() for word in parts[1:])
+    except Exception as e:
+        print(f"驼峰转换失败: {e} | 原始值: {s}")
+        return s  # 降级处理
+
+
+# 判断是否为打包环境
+if getattr(sys, 'frozen', False):
+    base_dir = sys._MEIPASS  # 临时解压目录
+else:
+    base_dir = os.path.dirname(__file__)
+
+
+class OutputMode(Enum):
+    package = 1
+    write_into_path = 2
+
+
+@dataclass
+class DbConfig:
+    host: Optional[str] = None
+    port: Optional[int] = None
+    user: Optional[str] = None
+    password: Optional[str] = None
+    database: Optional[str] = None
+
+    @staticmethod
+    def default_db():
+        res = DbConfig()
+        res.host = 'localhost'
+        res.port = 3306
+        res.user = 'root'
+        res.password = '123456'
+        res.database = 'test'
+        return res
+
+
+@dataclass
+class GenerateConfig:
+    type_map: Optional[dict] = field(default_factory=dict)
+    entity_package: Optional[str] = None
+    dao_package: Optional[str] = None
+    xml_path: Optional[str] = None
+    # 模板清单，为空时使用 DEFAULT_TEMPLATES
+    templates: Optional[list] = None
+
+
+@dataclass
+class Configuration:
+    name: Optional[str] = None
+    db: Optional[DbConfig] = None
+    # 输出模式；1：压缩包，2：直接写入指定目录
+    output_mode: Optional[int] = None
+    output_path: Optional[str] = None
+    generate_config: Optional[GenerateConfig] = None
+
+    @staticmethod
+    def default_config():
+        cfg = Configuration()
+        cfg.name = "默认"
+        cfg.db = DbConfig.default_db()
+        cfg.generate_config = GenerateConfig()
+        cfg.generate_config.type_map = DEFAULT_TYPE_MAP
+        cfg.generate_config.xml_path = 'mappers'
+        cfg.output_mode = OutputMode.package.name
+        return cfg
+
+    @staticmethod
+    def empty_config():
+        cfg = Configuration()
+        cfg.name = ""
+        cfg.db = DbConfig()
+        cfg.generate_config = GenerateConfig()
+        cfg.generate_config.type_map = DEFAULT_TYPE_MAP
+        cfg.generate_config.xml_path = 'mappers'
+        cfg.output_mode = OutputMode.package.name
+        return cfg
+
+    def to_json(self, **kwargs) -> str:
+        """序列化为 json 字符串，参数透传给 json.dumps"""
+        return json.dumps(asdict(self), **kwargs)
+
+    @staticmethod
+    def from_dict(item: dict):
+        config_obj = Configuration()
+        config_obj.name = item.get('name')
+        config_obj.output_mode = item.get('output_mode')
+        config_obj.output_path = item.get('output_path')
+
+        db_js = item.get('db') or {}
+        config_obj.db = DbConfig()
+        db = config_obj.db
+        db.host = db_js.get('host')
+        db.port = int(db_js.get('port') or 3306)
+        db.user = db_js.get('user')
+        db.password = db_js.get('password')
+        db.database = db_js.get('database')
+
+        generate_config_js = item.get('generate_config') or {}
+        config_obj.generate_config = GenerateConfig()
+        generate_config = config_obj.generate_config
+        generate_config.type_map = generate_config_js.get('type_map') or DEFAULT_TYPE_MAP
+        generate_config.entity_package = generate_config_js.get('entity_package')
+        generate_config.dao_package = generate_config_js.get('dao_package')
+        generate_config.xml_path = generate_config_js.get('xml_path')
+        generate_config.templates = generate_config_js.get('templates')
+        return config_obj
+
+    @staticmethod
+    def load_from_file(file_path) -> []:
+        try:
+            if os.path.exists(file_path):
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    js_config = json.load(f)
+                    return [Configuration.from_dict(item) for item in js_config]
+        except Exception as e:
+            print(f"file_path load failed {e}")
+        return [Configuration.default_config()]
+
+
+def map_java_type(mysql_type, type_map):
+    mysql_type = mysql_type.upper()
+    for key in sorted(type_map.keys(), key=len, reverse=True):
+        if key in mysql_type:
+            return type_map[key]
+    return "Object"
+
+
+def create_jinja_env(type_map):
+    """
+    创建模板环境；同一份 type_map 的环境可以在多个 CodeGenerator 之间共享，
+    已加载的模板会缓存在环境里，避免重复编译。
+    模板清单可能来自生成服务的请求，使用沙箱环境防止条件表达式访问 Python 内部对象
+    """
+    from jinja2 import FileSystemLoader
+    from jinja2.sandbox import SandboxedEnvironment
+
+    # 初始化模板工具
+    env = SandboxedEnvironment(loader=FileSystemLoader(os.path.join(base_dir, "templates")))
+    # 自定义驼峰工具
+    env.filters['camel_case'] = camel_case_filter
+    # 自定义大驼峰工具
+    env.filters['big_camel_case'] = big_camel_case_filter
+    # mysql data_type转javaType工具
+    env.filters['map_java_type'] = lambda mysql_type: map_java_type(mysql_type, type_map)
+    return env
+
+
+@dataclass
+class TemplateEntry:
+    # 模板文件名，位于 templates 目录
+    template: Optional[str] = None
+    # 输出路径，相对输出根目录，可用变量见 TemplateSet.PATH_VARIABLES
+    output: Optional[str] = None
+    # 生成条件，jinja2 表达式，可用变量与模板相同；为空时总是生成
+    condition: Optional[str] = None
+    # 生成文件所在的包，模板中为 package，输出路径中为 {package_path}
+    package: Optional[str] = None
+
+
+@dataclass
+class TemplateStats:
+    template: str
+    # 输出路径模板，同一模板可能对应多个清单项
+    output: str
+    # 渲染次数
+    renders: int = 0
+    # 条件不满足而跳过的次数
+    skipped: int = 0
+    # 累计渲染耗时（秒）
+    seconds: float = 0.0
+    # 累计输出大小（utf-8 字节）
+    bytes: int = 0
+
+
+def check_relative_path(path):
+    """输出路径必须是不含 .. 的相对路径，防止写到输出目录之外"""
+    for pure_path in (PurePosixPath(path), PureWindowsPath(path)):
+        if pure_path.is_absolute() or pure_path.anchor or ".." in pure_path.parts:
+            raise ValueError(f"输出路径必须是不含 .. 的相对路径: {path}")
+
+
+class TemplateSet:
+    """
+    编译后的模板清单：模板、条件表达式和输出路径在创建时一次性校验和编译，
+    渲染时条件不满足的模板直接跳过
+    """
+    PATH_VARIABLES = ("table", "entity_name", "entity_path", "dao_path", "xml_path", "package_path")
+
+    def __init__(self, templates, type_map):
+        from jinja2 import TemplateError
+
+        self.env = create_jinja_env(type_map)
+        self.entries = []
+        outputs = set()
+        for item in templates:
+            try:
+                entry = TemplateEntry(**item)
+            except TypeError as e:
+                raise ValueError(f"模板清单配置有误: {item} | {e}")
+            if not entry.template or not entry.output:
+                raise ValueError(f"模板清单缺少 template 或 output: {item}")
+            try:
+                fields = [(name, spec, conversion) for _, name, spec, conversion in Formatter().parse(entry.output)
+                          if name is not None]
+            except ValueError as e:
+                raise ValueError(f"输出路径格式有误: {entry.output} | {e}")
+            names = {name for name, _, _ in fields}
+            unknown = sorted(names - set(self.PATH_VARIABLES))
+            if unknown:
+                raise ValueError(f"输出路径中存在未知变量 {unknown}: {entry.output}")
+            if any(spec or conversion for _, spec, conversion in fields):
+                raise ValueError(f"输出路径中的变量不支持格式说明或转换: {entry.output}")
+            check_relative_path(entry.output)
+            if "package_path" in names and not entry.package:
+                raise ValueError(f"输出路径使用了 package_path，但未配置 package: {item}")
+            if entry.output in outputs:
+                raise ValueError(f"模板清单中存在重复的输出路径: {entry.output}")
+            outputs.add(entry.output)
+            try:
+                template = self.env.get_template(entry.template)
+                condition = self.env.compile_expression(entry.condition) if entry.condition else None
+            except TemplateError as e:
+                raise ValueError(f"模板清单编译失败: {item} | {e}")
+            self.entries.append((entry, template, condition))
+
+    def render(self, table, columns, generate_config: GenerateConfig, stats: dict):
+        """
+        渲染单个表，统计信息按清单项累加到 stats
+        :return: [(相对输出根目录的路径, 文件内容)]
+        """
+        path_variables = {
+            "table": table,
+            "entity_name": big_camel_case_filter(table),
+            "entity_path": str(generate_config.entity_package).replace(".", "/"),
+            "dao_path": str(generate_config.dao_package).replace(".", "/"),
+            "xml_path": generate_config.xml_path,
+        }
+        files = []
+        for index, (entry, template, condition) in enumerate(self.entries):
+            stat = stats.get(index)
+            if stat is None:
+                stat = stats[index] = TemplateStats(entry.template, entry.output)
+            context = {
+                "table": table,
+                "columns": columns,
+                "daoPackage": generate_config.dao_package,
+                "entityPackage": generate_config.entity_package,
+                "package": entry.package,
+            }
+            try:
+                if condition is not None and not condition(**context):
+                    stat.skipped += 1
+                    continue
+
+                start = time.perf_counter()
+                content = template.render(**context)
+                stat.seconds += time.perf_counter() - start
+            except Exception as e:
+                # 条件和模板可能来自请求，任何异常都视为清单有误
+                raise ValueError(f"渲染失败: {entry.template} -> {entry.output} | 表 {table} | "
+                                 f"{type(e).__name__}: {e}")
+            stat.renders += 1
+            stat.bytes += len(content.encode('utf-8'))
+
+            output = entry.output.format(package_path=str(entry.package).replace(".", "/"), **path_variables)
+            # 变量值（包名、xml 路径、表名）同样可能引入绝对路径或 ..
+            check_relative_path(output)
+            files.append((Path(output), content))
+        return files
+
+
+class CodeGenerator:
+    def __init__(self, config: Configuration, template_set: TemplateSet = None):
+        self.config = config
+        self.type_map = self.config.generate_config.type_map
+        # 模板清单在首次渲染时才编译，避免仅连接数据库时也导入 jinja2
+        self._template_set = template_set
+        # 每个模板的渲染统计，见 template_report
+        self.template_stats = {}
+        # 已生成的文件路径，防止不同表或不同模板输出到同一文件
+        self._emitted_paths = set()
+
+    @property
+    def template_set(self) -> TemplateSet:
+        if self._template_set is None:
+            templates = self.config.generate_config.templates or DEFAULT_TEMPLATES
+            self._template_set = TemplateSet(templates, self.type_map)
+        return self._template_set
+
+    @property
+    def jinja_env(self):
+        return self.template_set.env
+
+    def connect_db(self, host, port, user, password, database):
+        from generator_db import connect
+
+        conn = connect(host, port, user, password, database)
+        self._refresh_db_config(host, port, user, password, database)
+        return conn
+
+    def _refresh_db_config(self, host, port, user, password, database):
+        self.config.db.host = host
+        self.config.db.port = int(port)
+        self.config.db.user = user
+        self.config.db.password = password
+        self.config.db.database = database
+
+    def get_tables(self, conn):
+        from generator_db import get_tables
+
+        return get_tables(conn)
+
+    def get_table_columns(self, conn, table):
+        from generator_db import get_table_columns
+
+        return get_table_columns(conn, table)
+
+    def map_java_type(self, mysql_type):
+        return map_java_type(mysql_type, self.type_map)
+
+    def render_files(self, table, columns):
+        """
+        按模板清单渲染单个表的全部文件，不落盘
+        :return: [(相对输出根目录的路径, 文件内容)]
+        """
+        files = self.template_set.render(table, columns, self.config.generate_config, self.template_stats)
+        for relative_path, _ in files:
+            if relative_path in self._emitted_paths:
+                raise ValueError(f"多个模板输出到同一路径: {relative_path.as_posix()}，"
+                                 f"请在输出路径中使用 {{table}} 或 {{entity_name}}")
+            self._emitted_paths.add(relative_path)
+        return files
+
+    def template_report(self):
+        """按累计耗时倒序返回各模板的渲染统计"""
+        return sorted(self.template_stats.values(), key=lambda stat: stat.seconds, reverse=True)
+
+    def generate_code(self, table, columns):
+        output_base = Path(self.config.output_path)
+
+        # 根据输出模式确定最终路径
+        if self.config.output_mode == OutputMode.package.name:
+            # 压缩包模式，文件先写入临时目录
+            base_write_path = output_base / "temp"
+        else:
+            # 直接写入模式
+            base_write_path = output_base
+
+        # 写入文件
+        base_resolved = base_write_path.resolve()
+        for relative_path, content in self.render_files(table, columns):
+            file_path = base_write_path / relative_path
+            try:
+                file_path.resolve().relative_to(base_resolved)
+            except ValueError:
+                raise ValueError(f"输出路径超出输出目录: {relative_path}")
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_text(content, encoding='utf-8')
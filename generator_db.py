@@ -0,0 +1,132 @@
+"""
+数据库访问层：连接 MySQL 并读取表结构。
+
+pymysql 在首次连接时才导入，核心模块和 GUI 启动时均不会加载它。
+"""
+import queue
+import threading
+from contextlib import contextmanager
+
+
+def connect(host, port, user, password, database):
+    import pymysql
+
+    try:
+        return pymysql.connect(
+            host=host, port=int(port), user=user,
+            password=password, database=database, charset='utf8mb4'
+        )
+    except Exception as e:
+        raise Exception(f"数据库连接失败: {e}")
+
+
+def get_tables(conn):
+    with conn.cursor() as cursor:
+        cursor.execute("SHOW TABLES")
+        return [table[0] for table in cursor.fetchall()]
+
+
+def get_table_columns(conn, table):
+    import pymysql.cursors
+
+    with conn.cursor(pymysql.cursors.DictCursor) as cursor:
+        # 表名无法参数化，按 MySQL 规则转义反引号后引用
+        quoted = table.replace("`", "``")
+        cursor.execute(f"SHOW FULL COLUMNS FROM `{quoted}`")
+        return [
+            {"name": col["Field"], "type": col["Type"], "comment": col["Comment"]}
+            for col in cursor.fetchall()
+        ]
+
+
+def get_table_stamps(conn):
+    """
+    读取当前库所有表的 (CREATE_TIME, UPDATE_TIME)，用于判断表结构缓存是否失效
+    :return: {表名: (create_time, update_time)}，时间为字符串或 None
+    """
+    with conn.cursor() as cursor:
+        try:
+            # MySQL 8 默认缓存 information_schema 统计信息 24 小时，关闭缓存才能拿到最新时间
+            cursor.execute("SET SESSION information_schema_stats_expiry = 0")
+        except Exception:
+            # 5.7 及以下没有该变量，时间本身就是实时的
+            pass
+        cursor.execute(
+            "SELECT TABLE_NAME, CREATE_TIME, UPDATE_TIME FROM information_schema.TABLES "
+            "WHERE TABLE_SCHEMA = DATABASE()"
+        )
+        return {
+            name: (str(create_time) if create_time else None, str(update_time) if update_time else None)
+            for name, create_time, update_time in cursor.fetchall()
+        }
+
+
+class ConnectionPool:
+    """
+    简单的线程安全连接池，最多同时借出 max_size 个连接，归还的连接留待复用；
+    关闭后拒绝新的借出，仍在使用中的连接归还时直接关闭
+    """
+
+    def __init__(self, host, port, user, password, database, max_size=4):
+        self._params = (host, port, user, password, database)
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        self.closed = False
+
+    @contextmanager
+    def connection(self):
+        if self.closed:
+            raise RuntimeError("连接池已关闭")
+        self._slots.acquire()
+        try:
+            # 等待期间连接池可能已被关闭
+            if self.closed:
+                raise RuntimeError("连接池已关闭")
+            conn = self._take_idle() or connect(*self._params)
+            try:
+                yield conn
+            except Exception:
+                # 出错的连接状态未知，直接丢弃
+                _close_quietly(conn)
+                raise
+            else:
+                self._release(conn)
+        finally:
+            self._slots.release()
+
+    def _release(self, conn):
+        with self._lock:
+            if not self.closed:
+                self._idle.put(conn)
+                return
+        _close_quietly(conn)
+
+    def _take_idle(self):
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                return None
+            try:
+                conn.ping(reconnect=True)
+                return conn
+            except Exception:
+                _close_quietly(conn)
+
+    def close(self):
+        with self._lock:
+            self.closed = True
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            _close_quietly(conn)
+
+
+def _close_quietly(conn):
+    try:
+        conn.close()
+    except Exception:
+        pass
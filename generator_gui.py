@@ -0,0 +1,430 @@
+"""
+图形界面层：基于 tkinter 的配置与生成窗口。
+"""
+import json
+import shutil
+from pathlib import Path
+
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+
+from generator_core import DEFAULT_TEMPLATES, CodeGenerator, Configuration, OutputMode, TemplateSet, zip_folder
+
+
+class App(tk.Tk):
+    def __init__(self, file_path):
+        super().__init__()
+        self.title("MyBatis代码生成器")
+
+        # 设置窗口的最小尺寸，防止缩得太小导致控件错乱
+        self.minsize(450, 600)
+        # 配置主窗口的网格权重
+        # 第1列（包含大部分输入框）权重设为1，使其可以水平拉伸
+        self.grid_columnconfigure(1, weight=1)
+        # 第1行（包含表选择区域）权重设为1，使其可以垂直拉伸
+        self.grid_rowconfigure(1, weight=1)
+
+        self.file_path = file_path
+        self.config_list = Configuration.load_from_file(file_path)
+        self.generator = None
+        # 当前配置编译好的模板清单，切换配置时重新编译，生成时复用
+        self.template_set = None
+        self.template_set_config = None
+        # 当前配置索引
+        self.active_config_index = None
+        self._setup_ui()
+        self._load_last_config()
+
+    def _setup_ui(self):
+        # 使用一个局部变量来跟踪行号，比原来的全局 index 更清晰
+        row_index = 0
+
+        # --- 数据库配置区域 ---
+        db_config_frame = ttk.LabelFrame(self, text="数据库配置")
+        # 修改: 使用 sticky='ew' 让控件横向填充，columnspan=3 让其跨越3列
+        db_config_frame.grid(row=row_index, column=0, columnspan=3, padx=10, pady=5, sticky="ew")
+        row_index += 1
+
+        # 为容器配置列权重，让输入框列可以拉伸
+        db_config_frame.grid_columnconfigure(1, weight=1)
+
+        ttk.Label(db_config_frame, text="选择配置:").grid(row=0, column=0, sticky="w", padx=5, pady=2)
+        self.datasource_var = tk.StringVar()
+        self.datasource_list = list(map(lambda x: x.name, self.config_list))
+        self.datasource_var.set(self.datasource_list[0] if self.datasource_list else "")
+        self.datasource_combo = ttk.Combobox(db_config_frame,
+                                             textvariable=self.datasource_var,
+                                             values=self.datasource_list)
+        if self.datasource_list:
+            self.datasource_combo.current(0)
+            self.active_config_index = 0
+        self.datasource_combo.bind("<<ComboboxSelected>>", self._on_combobox_select)
+        self.datasource_combo.bind("<FocusOut>", self._check_option_and_update_cfg)
+        self.datasource_combo.bind("<Return>", self._check_option_and_update_cfg)
+
+        # 修改: 使用 sticky='ew' 让下拉框横向填充
+        self.datasource_combo.grid(row=0, column=1, sticky="ew", padx=5, pady=2)
+
+        ttk.Button(db_config_frame, text="+", width=2, command=self._add_new_config).grid(row=0, column=2, padx=5)
+        ttk.Button(db_config_frame, text="-", width=2, command=self._delete_config).grid(row=0, column=3, padx=5)
+
+        self.datasource_fields = ["host", "port", "user", "password", "database"]
+        self.entries = {}
+        for i, field in enumerate(self.datasource_fields, start=1):
+            ttk.Label(db_config_frame, text=field.capitalize() + ":").grid(row=i, column=0, sticky="w", padx=5, pady=2)
+            if field == 'password':
+                self.show_password = tk.BooleanVar()
+                entry = ttk.Entry(db_config_frame, show="*")
+                (ttk.Checkbutton(db_config_frame, text="", variable=self.show_password, command=self._toggle_password)
+                 .grid(row=i, column=3, sticky="w", padx=5, pady=2))
+            else:
+                entry = ttk.Entry(db_config_frame)
+            entry.bind('<FocusOut>', self._refresh_db_obj)
+            entry.bind("<Return>", self._refresh_db_obj)
+            # 修改: 使用 sticky='ew' 让输入框横向填充
+            entry.grid(row=i, column=1, columnspan=2, sticky="ew", padx=5, pady=2)
+            self.entries[field] = entry
+
+        ttk.Button(db_config_frame, text="测试连接", command=self.try_connect_db).grid(
+            row=len(self.datasource_fields) + 1, column=1, pady=5)
+
+        # --- 表选择区域 ---
+        # 这个区域是垂直拉伸的关键
+        table_frame = ttk.LabelFrame(self, text="表选择")
+        # 修改: columnspan=3 让其跨越3列, sticky='nsew' 让其填充水平和垂直空间
+        table_frame.grid(row=row_index, column=0, columnspan=3, padx=10, pady=5, sticky="nsew")
+        row_index += 1
+
+        # --- 新增: 配置 table_frame 内部的网格权重 ---
+        table_frame.grid_columnconfigure(0, weight=1)
+        table_frame.grid_rowconfigure(1, weight=1)
+
+        # 表操作按钮区域 (位于 table_frame 内部的第0行)
+        btn_frame = ttk.Frame(table_frame)
+        btn_frame.grid(row=0, column=0, sticky="ew", pady=5)
+        ttk.Button(btn_frame, text="全部勾选", width=10, command=self.select_all_tables).pack(side=tk.LEFT, padx=5)
+        ttk.Button(btn_frame, text="全部取消", width=10, command=self.deselect_all_tables).pack(side=tk.LEFT, padx=5)
+
+        # 表选择列表框 (位于 table_frame 内部的第1行)
+        list_frame = ttk.Frame(table_frame)
+        list_frame.grid(row=1, column=0, sticky="nsew")
+
+        # 配置 list_frame 内部的网格权重 ---
+        list_frame.grid_rowconfigure(0, weight=1)
+        list_frame.grid_columnconfigure(0, weight=1)
+
+        self.table_list = tk.Listbox(list_frame, selectmode="extended", height=8)
+        self.table_list.grid(row=0, column=0, sticky="nsew")
+        scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.table_list.yview)
+        scrollbar.grid(row=0, column=1, sticky="ns")
+        self.table_list.config(yscrollcommand=scrollbar.set)
+
+        # --- 生成配置区域 ---
+        gen_config_frame = ttk.LabelFrame(self, text="生成配置")
+        gen_config_frame.grid(row=row_index, column=0, columnspan=3, padx=10, pady=5, sticky="ew")
+        row_index += 1
+
+        gen_config_frame.grid_columnconfigure(1, weight=1)
+
+        ttk.Label(gen_config_frame, text="输出方式:").grid(row=0, column=0, sticky="w", padx=5, pady=2)
+        self.output_mode = tk.StringVar(value=OutputMode.package.name)
+        form_frame = tk.Frame(gen_config_frame)
+        form_frame.grid(row=0, column=1, columnspan=2, sticky="w")
+        rb1 = tk.Radiobutton(form_frame, text="压缩包", variable=self.output_mode, value=OutputMode.package.name)
+        rb1.pack(side=tk.LEFT)
+        rb2 = tk.Radiobutton(form_frame, text="写入目录", variable=self.output_mode,
+                             value=OutputMode.write_into_path.name)
+        rb2.pack(side=tk.LEFT)
+
+        ttk.Label(gen_config_frame, text="输出路径:").grid(row=1, column=0, sticky="w", padx=5, pady=2)
+        self.output_entry = ttk.Entry(gen_config_frame)
+        self.output_entry.grid(row=1, column=1, sticky="ew", padx=(5, 0))
+        ttk.Button(gen_config_frame, text="浏览", command=self.browse_path).grid(row=1, column=2, padx=(0, 5))
+
+        ttk.Label(gen_config_frame, text="实体包名:").grid(row=2, column=0, sticky="w", padx=5, pady=2)
+        self.entity_package_entry = ttk.Entry(gen_config_frame)
+        self.entity_package_entry.grid(row=2, column=1, columnspan=2, sticky="ew", padx=5)
+
+        ttk.Label(gen_config_frame, text="接口包名:").grid(row=3, column=0, sticky="w", padx=5, pady=2)
+        self.interface_package_entry = ttk.Entry(gen_config_frame)
+        self.interface_package_entry.grid(row=3, column=1, columnspan=2, sticky="ew", padx=5)
+
+        ttk.Label(gen_config_frame, text="xml路径:").grid(row=4, column=0, sticky="w", padx=5, pady=2)
+        self.xml_path_entry = ttk.Entry(gen_config_frame)
+        self.xml_path_entry.grid(row=4, column=1, sticky="ew", padx=(5, 0))
+        ttk.Button(gen_config_frame, text="保存配置", command=self.save_file).grid(row=4, column=2, padx=(0, 5))
+
+        # --- 操作按钮 ---
+        action_frame = ttk.Frame(self)
+        action_frame.grid(row=row_index, column=0, columnspan=3, pady=10)
+        row_index += 1
+
+        start_button = ttk.Button(action_frame, text="生成代码", command=self.generate)
+        start_button.pack()
+
+    def _toggle_password(self):
+        if self.show_password.get():
+            self.entries.get('password').config(show='')
+        else:
+            self.entries.get('password').config(show="*")
+
+    def _on_combobox_select(self, event):
+        self.active_config_index = self.datasource_combo.current()
+        datasource_config = self.config_list[self.active_config_index]
+        self._update_all_info_from_cfg(datasource_config)
+
+    def _update_all_info_from_cfg(self, datasource_config):
+        self._update_db_info_from_cfg(datasource_config)
+        self.output_mode.set(datasource_config.output_mode)
+        self.output_entry.delete(0, tk.END)
+        self.output_entry.insert(0, datasource_config.output_path if datasource_config.output_path else './')
+        entity_package = datasource_config.generate_config.entity_package
+        self.entity_package_entry.delete(0, tk.END)
+        self.entity_package_entry.insert(0, entity_package if entity_package else "com.example.dao.pojo")
+        dao_package = datasource_config.generate_config.dao_package
+        self.interface_package_entry.delete(0, tk.END)
+        self.interface_package_entry.insert(0, dao_package if dao_package else "com.example.dao")
+        self.table_list.delete(0, tk.END)
+        xml_path = datasource_config.generate_config.xml_path
+        self.xml_path_entry.delete(0, tk.END)
+        self.xml_path_entry.insert(0, xml_path if xml_path else 'resource/mappers')
+        self.template_set = None
+        self.template_set_config = datasource_config
+        # 窗口显示后再编译，避免启动时就导入 jinja2
+        self.after_idle(self._compile_template_set, datasource_config)
+
+    def _compile_template_set(self, config: Configuration):
+        if config is not self.template_set_config:
+            return  # 已切换到其他配置
+        try:
+            templates = config.generate_config.templates or DEFAULT_TEMPLATES
+            self.template_set = TemplateSet(templates, config.generate_config.type_map)
+        except Exception as e:
+            messagebox.showerror("模板清单有误", str(e))
+
+    def _refresh_db_obj(self, event):
+        if self.active_config_index is not None and self.active_config_index < len(self.config_list):
+            config = self.config_list[self.active_config_index]
+            self._update_db_cfg_from_info(config)
+
+    def _update_all_cfg_from_info(self, config: Configuration):
+        self._update_db_cfg_from_info(config)
+        config.output_mode = self.output_mode.get()
+        config.output_path = self.output_entry.get()
+        config.generate_config.entity_package = self.entity_package_entry.get()
+        config.generate_config.dao_package = self.interface_package_entry.get()
+        config.generate_config.xml_path = self.xml_path_entry.get()
+
+    def _update_db_cfg_from_info(self, config: Configuration):
+        for field, entry in self.entries.items():
+            if field == 'host':
+                config.db.host = entry.get()
+            if field == 'port':
+                try:
+                    config.db.port = int(entry.get())
+                except (ValueError, TypeError):
+                    config.db.port = 3306  # Default port if entry is invalid
+            if field == 'user':
+                config.db.user = entry.get()
+            if field == 'password':
+                config.db.password = entry.get()
+            if field == 'database':
+                config.db.database = entry.get()
+
+    def _check_option_and_update_cfg(self, event):
+        """
+        当Combobox失去焦点或按下回车时，更新配置名称。
+        优化点：不使用 .current()，而是使用 self.active_config_index。
+        """
+        if self.active_config_index is None:
+            return  # 如果没有活动索引，则不执行任何操作
+
+        new_name = self.datasource_var.get()
+        # 检查新名称是否为空
+        if not new_name.strip():
+            # 如果名称为空，恢复为旧名称并提示用户
+            old_name = self.config_list[self.active_config_index].name
+            self.datasource_var.set(old_name)
+            messagebox.showwarning("提示", "配置名称不能为空！")
+            return
+
+        old_name = self.config_list[self.active_config_index].name
+
+        # 仅当名称发生变化时才更新
+        if old_name != new_name:
+            # 1. 更新数据模型中的名称
+            self.config_list[self.active_config_index].name = new_name
+
+            # 2. 更新Combobox显示列表
+            values = list(self.datasource_combo['values'])
+            values[self.active_config_index] = new_name
+            self.datasource_combo['values'] = values
+            print(f"配置名称已从 '{old_name}' 更新为 '{new_name}'")
+
+    def _add_new_config(self):
+        new_cfg = Configuration.empty_config()
+        new_name_base = "新配置"
+        new_name_suffix = 1
+        existing_names = {cfg.name for cfg in self.config_list}
+
+        # 确保新名称不重复
+        new_name = f"{new_name_base}_{new_name_suffix}"
+        while new_name in existing_names:
+            new_name_suffix += 1
+            new_name = f"{new_name_base}_{new_name_suffix}"
+
+        new_cfg.name = new_name
+        self.config_list.append(new_cfg)
+
+        new_options = list(self.datasource_combo['values'])
+        new_options.append(new_cfg.name)
+        self.datasource_combo['values'] = new_options
+
+        new_index = len(self.config_list) - 1
+        self.datasource_combo.current(new_index)
+
+        # 更新活动索引
+        self.active_config_index = new_index
+        self._update_all_info_from_cfg(new_cfg)
+
+    def _delete_config(self):
+        if len(self.config_list) == 1:
+            return
+        current_index = self.active_config_index
+        current_config = self.config_list.pop(current_index)
+        options = list(self.datasource_combo['values'])
+        options.remove(current_config.name)
+        self.datasource_combo['values'] = options
+        new_index = len(options) - 1
+        self.datasource_combo.current(new_index)
+
+        # 更新活动索引
+        self.active_config_index = new_index
+        self._update_all_info_from_cfg(self.config_list[new_index])
+
+    def _load_last_config(self):
+        if not self.config_list:
+            self._add_new_config()
+        else:
+            self.active_config_index = self.datasource_combo.current()
+            if self.active_config_index == -1 and self.config_list:
+                self.active_config_index = 0  # 默认指向第一个
+                self.datasource_combo.current(0)
+            datasource_config = self.config_list[self.active_config_index]
+            self._update_all_info_from_cfg(datasource_config)
+
+    def _update_db_info_from_cfg(self, datasource_config):
+        for field, entry in self.entries.items():
+            entry.delete(0, tk.END)
+            value = getattr(datasource_config.db, field, '')
+            entry.insert(0, str(value) if value is not None else '')
+
+    def try_connect_db(self):
+        try:
+            config_index = self.active_config_index
+            if config_index == -1:
+                messagebox.showerror("错误", "请先选择一个配置")
+                return
+            config = self.config_list[config_index]
+            self._update_all_cfg_from_info(config)  # Ensure current entries are used
+            self.generator = CodeGenerator(config)
+            conn = self.generator.connect_db(
+                config.db.host,
+                config.db.port,
+                config.db.user,
+                config.db.password,
+                config.db.database
+            )
+            tables = self.generator.get_tables(conn)
+            self.table_list.delete(0, tk.END)
+            for table in tables:
+                self.table_list.insert(tk.END, table)
+            conn.close()
+            # messagebox.showinfo("成功", "数据库连接成功，已加载所有表！")
+        except Exception as e:
+            messagebox.showerror("连接失败", str(e))
+
+    def browse_path(self):
+        path = filedialog.askdirectory()
+        if path:
+            self.output_entry.delete(0, tk.END)
+            self.output_entry.insert(0, path)
+
+    def select_all_tables(self):
+        """全选所有表"""
+        self.table_list.selection_set(0, tk.END)
+
+    def deselect_all_tables(self):
+        """取消全选"""
+        self.table_list.selection_clear(0, tk.END)
+
+    def save_file(self):
+        try:
+            rs = []
+            current_config_index = self.active_config_index
+            if current_config_index != -1:
+                current_config = self.config_list[current_config_index]
+                self._update_all_cfg_from_info(current_config)
+
+            for config in self.config_list:
+                rs.append(json.loads(config.to_json(ensure_ascii=False)))
+
+            config_path = Path(self.file_path)
+            config_path.parent.mkdir(parents=True, exist_ok=True)
+
+            with open(config_path, 'w', encoding='utf-8') as f:
+                json.dump(rs, f, indent=4, ensure_ascii=False)
+            messagebox.showinfo("成功", f"配置已保存到:\n{config_path.resolve()}")
+        except Exception as e:
+            messagebox.showerror("保存失败", f"保存配置文件时出错: {e}")
+
+    def generate(self):
+        try:
+            current_config_index = self.active_config_index
+            if current_config_index == -1:
+                messagebox.showerror("错误", "请先选择一个配置")
+                return
+
+            config = self.config_list[current_config_index]
+            self._update_all_cfg_from_info(config)
+            # 复用切换配置时编译好的模板清单；编译失败时这里会再次报错
+            template_set = self.template_set if self.template_set_config is config else None
+            self.generator = CodeGenerator(config, template_set)
+
+            selected_tables = [self.table_list.get(i) for i in self.table_list.curselection()]
+            if not selected_tables:
+                messagebox.showwarning("警告", "请选择至少一个表")
+                return
+
+            if not self.generator.config.output_path:
+                messagebox.showwarning("警告", "请指定输出路径")
+                return
+
+            conn = self.generator.connect_db(
+                host=self.generator.config.db.host,
+                port=self.generator.config.db.port,
+                user=self.generator.config.db.user,
+                password=self.generator.config.db.password,
+                database=self.generator.config.db.database
+            )
+            for table in selected_tables:
+                columns = self.generator.get_table_columns(conn, table)
+                self.generator.generate_code(table, columns)
+            conn.close()
+            for stat in self.generator.template_report():
+                print(f"{stat.template} -> {stat.output}: 渲染 {stat.renders} 次，跳过 {stat.skipped} 次，"
+                      f"耗时 {stat.seconds * 1000:.1f}ms，输出 {stat.bytes} 字节")
+
+            if self.generator.config.output_mode == OutputMode.package.name:
+                output_path = Path(self.generator.config.output_path)
+                temp_folder = output_path / "temp"
+                zip_file = output_path / "output.zip"
+                zip_folder(str(temp_folder), str(zip_file))
+                try:
+                    shutil.rmtree(temp_folder)
+                except Exception as e:
+                    print(f"删除临时文件失败：{e}")
+
+            messagebox.showinfo("成功", f"已生成 {len(selected_tables)} 个表的代码！")
+        except Exception as e:
+            messagebox.showerror("生成失败", str(e))
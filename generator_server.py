@@ -0,0 +1,429 @@
+"""
+本地生成服务：把 CodeGenerator 包装成一个 HTTP/JSON 接口，供团队共用。
+
+服务进程常驻，复用以下缓存：
+- 模板清单：同一份 type_map + 模板清单只编译一次
+- 数据库连接：每个数据源一个连接池
+- 表结构：按 information_schema 中的 CREATE_TIME / UPDATE_TIME 判断是否失效
+
+接口：
+    GET  /health                      服务状态
+    GET  /tables?config=<配置名>      列出表
+    POST /generate                    生成代码，请求体：
+        {
+            "config": "配置名" 或 完整配置对象（与 config.json 中的单项格式一致）,
+            "tables": ["user_info", ...],     # 为空时生成全部表
+            "format": "zip" | "manifest",     # 默认 zip
+            "refresh": false                  # true 时忽略表结构缓存
+        }
+    zip 返回 application/zip 流；manifest 返回
+        {"files": [{"path", "size", "content"}], "templates": [各模板的渲染次数、跳过次数、耗时和输出大小]}
+
+不连真实数据库时可以用 --snapshot 指定表结构快照（--dump-snapshot 从数据库导出）。
+"""
+import argparse
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+import zipfile
+from collections import OrderedDict
+from dataclasses import asdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from generator_core import DEFAULT_TEMPLATES, CodeGenerator, Configuration, TemplateSet, config_cache_path
+
+
+class LruCache:
+    """线程安全的 LRU 缓存，超出容量时淘汰最久未使用的项，on_evict 用于释放被淘汰的值"""
+
+    def __init__(self, max_size, on_evict=None):
+        self.max_size = max_size
+        self.on_evict = on_evict
+        self._lock = threading.Lock()
+        self._items = OrderedDict()
+
+    def get(self, key):
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def put(self, key, value, overwrite=True):
+        """
+        写入缓存并返回实际缓存的值
+        :param overwrite: 为 False 时若 key 已存在则保留旧值，用于并发创建同一个对象
+        """
+        with self._lock:
+            existing = self._items.get(key)
+            if existing is not None and not overwrite:
+                self._items.move_to_end(key)
+                return existing
+            self._items[key] = value
+            self._items.move_to_end(key)
+            evicted = []
+            while len(self._items) > self.max_size:
+                evicted.append(self._items.popitem(last=False)[1])
+        self._release(evicted)
+        return value
+
+    def clear(self):
+        with self._lock:
+            evicted = list(self._items.values())
+            self._items.clear()
+        self._release(evicted)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._items)
+
+    def _release(self, values):
+        if self.on_evict:
+            for value in values:
+                self.on_evict(value)
+
+
+class MySqlSchemaSource:
+    """从 MySQL 读取表结构，连接来自连接池"""
+
+    def __init__(self, db, pool_size=4):
+        from generator_db import ConnectionPool
+
+        self.key = MySqlSchemaSource.make_key(db)
+        self.pool = ConnectionPool(db.host, db.port or 3306, db.user, db.password, db.database, pool_size)
+
+    @staticmethod
+    def make_key(db):
+        # 密码参与 key，避免不同凭据的请求共用同一个连接池
+        password_hash = hashlib.sha256((db.password or '').encode('utf-8')).hexdigest()
+        return "mysql", db.host, int(db.port or 3306), db.user, db.database, password_hash
+
+    def get_tables(self):
+        from generator_db import get_tables
+
+        with self.pool.connection() as conn:
+            return get_tables(conn)
+
+    def get_table_stamps(self):
+        from generator_db import get_table_stamps
+
+        with self.pool.connection() as conn:
+            return get_table_stamps(conn)
+
+    def get_table_columns(self, table):
+        from generator_db import get_table_columns
+
+        with self.pool.connection() as conn:
+            return get_table_columns(conn, table)
+
+    def close(self):
+        self.pool.close()
+
+
+class SnapshotSchemaSource:
+    """
+    从 json 快照读取表结构，用于本机测试，格式：
+    {"tables": {"user_info": {"stamp": [...], "columns": [{"name", "type", "comment"}]}}}
+    快照文件被修改后会自动重新加载
+    """
+
+    def __init__(self, path):
+        self.key = ("snapshot", os.path.abspath(path))
+        self.path = path
+        self._lock = threading.Lock()
+        self._mtime = None
+        self._tables = {}
+
+    def _load(self):
+        with self._lock:
+            mtime = os.path.getmtime(self.path)
+            if mtime != self._mtime:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._tables = json.load(f).get('tables', {})
+                self._mtime = mtime
+            return self._tables
+
+    def get_tables(self):
+        return sorted(self._load().keys())
+
+    def get_table_stamps(self):
+        return {name: tuple(table.get('stamp') or ()) for name, table in self._load().items()}
+
+    def get_table_columns(self, table):
+        tables = self._load()
+        if table not in tables:
+            raise KeyError(f"快照中不存在表: {table}")
+        return tables[table]['columns']
+
+    def close(self):
+        pass
+
+    @staticmethod
+    def dump(source, path, tables=None):
+        """把任意数据源的表结构导出为快照文件"""
+        stamps = source.get_table_stamps()
+        result = {}
+        for table in tables or source.get_tables():
+            result[table] = {"stamp": list(stamps.get(table) or ()), "columns": source.get_table_columns(table)}
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"tables": result}, f, indent=4, ensure_ascii=False)
+
+
+class SchemaCache:
+    """表结构缓存，表的时间戳变化时重新读取；没有时间戳的表（如视图）每次都重新读取"""
+
+    def __init__(self, max_size=4096):
+        self._entries = LruCache(max_size)
+
+    def get_columns(self, source, table, stamp, refresh=False):
+        key = (source.key, table)
+        cacheable = bool(stamp) and any(value is not None for value in stamp)
+        if not cacheable:
+            return source.get_table_columns(table)
+        entry = self._entries.get(key)
+        if entry is not None and not refresh and entry[0] == stamp:
+            return entry[1]
+        columns = source.get_table_columns(table)
+        self._entries.put(key, (stamp, columns))
+        return columns
+
+
+class GenerationService:
+    """服务端状态：配置、数据源、模板环境和表结构缓存，可被多个请求线程并发使用"""
+
+    def __init__(self, config_path=config_cache_path, snapshot_path=None, pool_size=4,
+                 max_sources=16, max_template_sets=32):
+        self.config_path = config_path
+        self.snapshot_path = snapshot_path
+        self.pool_size = pool_size
+        self.schema_cache = SchemaCache()
+        self._sources = LruCache(max_sources, on_evict=lambda source: source.close())
+        self._template_sets = LruCache(max_template_sets)
+
+    def resolve_config(self, config) -> Configuration:
+        if isinstance(config, dict):
+            check_inline_config(config)
+            return Configuration.from_dict(config)
+        if config is not None and not isinstance(config, str):
+            raise ValueError("config 必须是配置名或配置对象")
+        # 每次请求重新读取配置文件，修改配置后无需重启服务
+        config_list = Configuration.load_from_file(self.config_path)
+        if config is None:
+            return config_list[0]
+        for item in config_list:
+            if item.name == config:
+                return item
+        raise KeyError(f"配置不存在: {config}")
+
+    def get_source(self, config: Configuration):
+        if self.snapshot_path:
+            key = ("snapshot", os.path.abspath(self.snapshot_path))
+        else:
+            key = MySqlSchemaSource.make_key(config.db)
+        source = self._sources.get(key)
+        if source is None:
+            if self.snapshot_path:
+                source = SnapshotSchemaSource(self.snapshot_path)
+            else:
+                source = MySqlSchemaSource(config.db, self.pool_size)
+            cached = self._sources.put(key, source, overwrite=False)
+            if cached is not source:
+                source.close()
+            source = cached
+        return source
+
+    def get_template_set(self, generate_config) -> TemplateSet:
+        templates = generate_config.templates or DEFAULT_TEMPLATES
+        key = json.dumps([generate_config.type_map, templates], sort_keys=True)
+        template_set = self._template_sets.get(key)
+        if template_set is None:
+            # 在锁外编译，避免阻塞其他请求
+            template_set = TemplateSet(templates, dict(generate_config.type_map))
+            template_set = self._template_sets.put(key, template_set, overwrite=False)
+        return template_set
+
+    def list_tables(self, config):
+        config = self.resolve_config(config)
+        return self.get_source(config).get_tables()
+
+    def render(self, config, tables=None, refresh=False):
+        """
+        渲染指定表，不落盘
+        :return: ([(相对路径, 文件内容)], 按耗时倒序的模板统计)
+        """
+        if tables is not None and (not isinstance(tables, list) or not all(isinstance(t, str) for t in tables)):
+            raise ValueError("tables 必须是表名字符串数组")
+        config = self.resolve_config(config)
+        source = self.get_source(config)
+        generator = CodeGenerator(config, self.get_template_set(config.generate_config))
+        stamps = source.get_table_stamps()
+        # 只允许生成数据源中真实存在的表
+        unknown = [table for table in tables or () if table not in stamps]
+        if unknown:
+            raise KeyError(f"表不存在: {', '.join(unknown)}")
+        files = []
+        for table in tables or sorted(stamps.keys()):
+            columns = self.schema_cache.get_columns(source, table, stamps.get(table), refresh)
+            files.extend(generator.render_files(table, columns))
+        return files, generator.template_report()
+
+    def close(self):
+        self._sources.clear()
+
+
+def check_inline_config(config: dict):
+    """校验请求中内联配置的结构，类型不对时抛出 ValueError"""
+    for name in ('db', 'generate_config'):
+        if config.get(name) is not None and not isinstance(config[name], dict):
+            raise ValueError(f"config.{name} 必须是对象")
+    port = (config.get('db') or {}).get('port')
+    if port is not None and not (isinstance(port, int) or (isinstance(port, str) and port.isdigit())):
+        raise ValueError("db.port 必须是数字")
+    generate_config = config.get('generate_config') or {}
+    type_map = generate_config.get('type_map')
+    if type_map is not None and not (
+            isinstance(type_map, dict) and all(isinstance(v, str) for v in type_map.values())):
+        raise ValueError("generate_config.type_map 必须是 {mysql 类型: java 类型} 对象")
+    templates = generate_config.get('templates')
+    if templates is not None and not (
+            isinstance(templates, list) and all(isinstance(item, dict) for item in templates)
+            and all(value is None or isinstance(value, str) for item in templates for value in item.values())):
+        raise ValueError("generate_config.templates 必须是对象数组，且各字段为字符串")
+    for name in ('entity_package', 'dao_package', 'xml_path'):
+        if generate_config.get(name) is not None and not isinstance(generate_config[name], str):
+            raise ValueError(f"generate_config.{name} 必须是字符串")
+
+
+def files_to_zip(files) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        for relative_path, content in files:
+            zipf.writestr(relative_path.as_posix(), content)
+    return buffer.getvalue()
+
+
+def files_to_manifest(files, report) -> dict:
+    return {
+        "files": [
+            {"path": relative_path.as_posix(), "size": len(content.encode('utf-8')), "content": content}
+            for relative_path, content in files
+        ],
+        "templates": [asdict(stat) for stat in report],
+    }
+
+
+class GenerationRequestHandler(BaseHTTPRequestHandler):
+    # 由 make_server 注入
+    service: GenerationService = None
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/health":
+            self._send_json(200, {"status": "ok"})
+        elif url.path == "/tables":
+            config = parse_qs(url.query).get('config', [None])[0]
+            self._handle(lambda: self._send_json(200, {"tables": self.service.list_tables(config)}))
+        else:
+            self._send_json(404, {"error": f"未知路径: {url.path}"})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path != "/generate":
+            self._send_json(404, {"error": f"未知路径: {url.path}"})
+            return
+        self._handle(self._generate)
+
+    def _generate(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        try:
+            body = json.loads(self.rfile.read(length) or b'{}')
+        except ValueError as e:
+            self._send_json(400, {"error": f"请求体不是合法的 json: {e}"})
+            return
+        if not isinstance(body, dict):
+            self._send_json(400, {"error": "请求体必须是 json 对象"})
+            return
+        output_format = body.get('format', 'zip')
+        if output_format not in ('zip', 'manifest'):
+            self._send_json(400, {"error": f"不支持的格式: {output_format}"})
+            return
+
+        start = time.perf_counter()
+        files, report = self.service.render(body.get('config'), body.get('tables'), bool(body.get('refresh')))
+        self.log_message("generated %d files in %.1fms", len(files), (time.perf_counter() - start) * 1000)
+        if report:
+            slowest = report[0]
+            self.log_message("slowest template %s: %.1fms", slowest.template, slowest.seconds * 1000)
+
+        if output_format == 'manifest':
+            self._send_json(200, files_to_manifest(files, report))
+        else:
+            self._send(200, files_to_zip(files), "application/zip",
+                       {"Content-Disposition": 'attachment; filename="output.zip"'})
+
+    def _handle(self, action):
+        try:
+            action()
+        except KeyError as e:
+            self._send_json(404, {"error": str(e.args[0] if e.args else e)})
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)})
+        except Exception as e:
+            self._send_json(500, {"error": str(e)})
+
+    def _send_json(self, status, data):
+        self._send(status, json.dumps(data, ensure_ascii=False).encode('utf-8'), "application/json; charset=utf-8")
+
+    def _send(self, status, payload: bytes, content_type, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+def make_server(service: GenerationService, host="127.0.0.1", port=8765) -> ThreadingHTTPServer:
+    handler = type("BoundGenerationRequestHandler", (GenerationRequestHandler,), {"service": service})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="MyBatis 代码生成服务")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--config", default=config_cache_path, help="配置文件路径")
+    parser.add_argument("--snapshot", help="使用表结构快照代替数据库")
+    parser.add_argument("--pool-size", type=int, default=4, help="每个数据源的最大连接数")
+    parser.add_argument("--dump-snapshot", metavar="PATH", help="把 --name 指定配置的表结构导出为快照后退出")
+    parser.add_argument("--name", help="配置名，默认第一个配置")
+    args = parser.parse_args(argv)
+
+    service = GenerationService(args.config, args.snapshot, args.pool_size)
+    if args.dump_snapshot:
+        config = service.resolve_config(args.name)
+        SnapshotSchemaSource.dump(service.get_source(config), args.dump_snapshot)
+        service.close()
+        print(f"快照已导出: {args.dump_snapshot}")
+        return
+
+    server = make_server(service, args.host, args.port)
+    print(f"生成服务已启动: http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+from benchmark_import import DEFAULT_BUDGET_MS, check_import_budget
+
+
+def test_core_import_within_budget():
+    ok, elapsed_ms, violations = check_import_budget("generator_core")
+    assert not violations, f"导入时加载了重依赖: {violations}"
+    assert ok, f"generator_core 导入耗时 {elapsed_ms:.1f}ms 超出预算 {DEFAULT_BUDGET_MS}ms"
+
+
+def test_entry_point_does_not_load_gui_or_db():
+    _, _, violations = check_import_budget("mybatis_generator", budget_ms=float("inf"))
+    assert not violations
@@ -0,0 +1,244 @@
+import io
+import json
+import os
+import threading
+import urllib.error
+import urllib.request
+import zipfile
+
+import pytest
+
+import generator_db
+from generator_core import DbConfig
+from generator_db import ConnectionPool
+from generator_server import GenerationService, LruCache, MySqlSchemaSource, SchemaCache, make_server
+
+SNAPSHOT = {
+    "tables": {
+        "user_info": {
+            "stamp": ["2024-01-01 00:00:00", None],
+            "columns": [
+                {"name": "id", "type": "bigint(20)", "comment": "主键"},
+                {"name": "user_name", "type": "varchar(32)", "comment": "用户名"},
+            ],
+        },
+        "order_item": {
+            "stamp": ["2024-01-02 00:00:00", None],
+            "columns": [{"name": "id", "type": "int", "comment": ""}],
+        },
+    }
+}
+
+CONFIG = {"generate_config": {"entity_package": "com.demo.po", "dao_package": "com.demo.dao", "xml_path": "mappers"}}
+
+
+def write_snapshot(path, data, mtime=None):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    path = tmp_path / "schema.json"
+    write_snapshot(path, SNAPSHOT, mtime=1_000_000)
+    return path
+
+
+@pytest.fixture
+def base_url(tmp_path, snapshot_path):
+    service = GenerationService(str(tmp_path / "missing.json"), str(snapshot_path))
+    server = make_server(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+    service.close()
+
+
+def request(url, body=None):
+    data = None if body is None else (body if isinstance(body, bytes) else json.dumps(body).encode('utf-8'))
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, data=data)) as resp:
+            return resp.status, resp.headers.get('Content-Type'), resp.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers.get('Content-Type'), e.read()
+
+
+def manifest(base_url, **body):
+    status, _, payload = request(f"{base_url}/generate", dict(body, format="manifest", config=CONFIG))
+    assert status == 200, payload
+    return json.loads(payload)
+
+
+def test_health_and_tables(base_url):
+    assert request(f"{base_url}/health")[0] == 200
+    status, _, payload = request(f"{base_url}/tables")
+    assert status == 200
+    assert json.loads(payload)["tables"] == ["order_item", "user_info"]
+
+
+def test_generate_zip(base_url):
+    status, content_type, payload = request(f"{base_url}/generate", {"config": CONFIG, "tables": ["user_info"]})
+    assert status == 200
+    assert content_type == "application/zip"
+    with zipfile.ZipFile(io.BytesIO(payload)) as zipf:
+        assert sorted(zipf.namelist()) == [
+            "java/com/demo/dao/UserInfoMapper.java",
+            "java/com/demo/po/UserInfo.java",
+            "resources/mappers/UserInfoMapper.xml",
+        ]
+        assert "private String userName;" in zipf.read("java/com/demo/po/UserInfo.java").decode('utf-8')
+
+
+def test_generate_manifest(base_url):
+    data = manifest(base_url)
+    paths = [item["path"] for item in data["files"]]
+    assert len(paths) == 6
+    assert "java/com/demo/po/OrderItem.java" in paths
+    for item in data["files"]:
+        assert item["size"] == len(item["content"].encode('utf-8'))
+    assert {stat["template"] for stat in data["templates"]} == {"Entity.java.j2", "Dao.java.j2", "Mapper.xml.j2"}
+    assert all(stat["renders"] == 2 for stat in data["templates"])
+
+
+def test_schema_cache_invalidated_by_stamp(base_url, snapshot_path):
+    def entity():
+        files = manifest(base_url, tables=["user_info"])["files"]
+        return next(item["content"] for item in files if item["path"].endswith("UserInfo.java"))
+
+    assert "userName" in entity()
+
+    changed = json.loads(json.dumps(SNAPSHOT))
+    changed["tables"]["user_info"]["columns"].append({"name": "nick_name", "type": "varchar(8)", "comment": ""})
+    # 时间戳不变时继续使用缓存的表结构
+    write_snapshot(snapshot_path, changed, mtime=1_000_001)
+    assert "nickName" not in entity()
+
+    changed["tables"]["user_info"]["stamp"][0] = "2024-02-01 00:00:00"
+    write_snapshot(snapshot_path, changed, mtime=1_000_002)
+    assert "nickName" in entity()
+
+
+@pytest.mark.parametrize("body", [
+    b"not json",
+    {"format": "tar"},
+    {"tables": "user_info"},
+    {"tables": [1]},
+    {"config": {"generate_config": {"templates": [{"template": "Dao.java.j2", "output": "{bad}"}]}}},
+    {"config": {"generate_config": {"templates": [{"template": "Missing.j2", "output": "a/{table}"}]}}},
+    {"config": {"generate_config": {"templates": [
+        {"template": "Dao.java.j2", "output": "a/{table}", "condition": "table =="}]}}},
+    {"config": {"generate_config": {"templates": [
+        {"template": "Dao.java.j2", "output": "a/{table}",
+         "condition": "().__class__.__base__.__subclasses__()|length > 0"}]}}},
+    {"config": {"generate_config": {"templates": [
+        {"template": "Dao.java.j2", "output": "a/{table}", "condition": "1/0"}]}}},
+    {"config": {"generate_config": {"templates": [{"template": "Dao.java.j2", "output": "../{table}"}]}}},
+    {"config": {"generate_config": {"templates": [{"template": "Dao.java.j2", "output": "x.java"}]}}},
+    [],
+    "user_info",
+    {"config": 5},
+    {"config": {"db": "localhost"}},
+    {"config": {"db": {"port": [1]}}},
+    {"config": {"generate_config": 5}},
+    {"config": {"generate_config": {"templates": 5}}},
+    {"config": {"generate_config": {"templates": [5]}}},
+    {"config": {"generate_config": {"templates": [{"template": 5, "output": "a/{table}"}]}}},
+    {"config": {"generate_config": {"type_map": 5}}},
+    {"config": {"generate_config": {"type_map": {"INT": 1}}}},
+])
+def test_bad_request(base_url, body):
+    status, _, payload = request(f"{base_url}/generate", body)
+    assert status == 400, payload
+
+
+@pytest.mark.parametrize("path, body", [
+    ("/generate", {"tables": ["no_such_table"]}),
+    ("/generate", {"tables": ["user_info; DROP TABLE user_info"]}),
+    ("/generate", {"config": "no_such_config"}),
+    ("/unknown", {}),
+    ("/unknown", None),
+])
+def test_not_found(base_url, path, body):
+    status, _, payload = request(f"{base_url}{path}", body)
+    assert status == 404, payload
+
+
+def test_pool_key_includes_password():
+    db = DbConfig(host="localhost", port=3306, user="root", password="a", database="test")
+    other = DbConfig(host="localhost", port=3306, user="root", password="b", database="test")
+    assert MySqlSchemaSource.make_key(db) != MySqlSchemaSource.make_key(other)
+    assert "a" not in MySqlSchemaSource.make_key(db)
+
+
+def test_lru_cache_evicts_oldest():
+    evicted = []
+    cache = LruCache(2, on_evict=evicted.append)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+    assert evicted == [2]
+    assert cache.put("a", 10, overwrite=False) == 1
+    assert len(cache) == 2
+
+
+class FakeSource:
+    key = ("fake",)
+
+    def __init__(self):
+        self.reads = 0
+
+    def get_table_columns(self, table):
+        self.reads += 1
+        return [{"name": "id", "type": "int", "comment": ""}]
+
+
+@pytest.mark.parametrize("stamp", [(), (None, None), None])
+def test_schema_cache_skips_missing_stamp(stamp):
+    cache, source = SchemaCache(), FakeSource()
+    cache.get_columns(source, "v_user", stamp)
+    cache.get_columns(source, "v_user", stamp)
+    assert source.reads == 2
+
+
+def test_schema_cache_hits_with_stamp():
+    cache, source = SchemaCache(), FakeSource()
+    cache.get_columns(source, "user_info", ("2024-01-01", None))
+    cache.get_columns(source, "user_info", ("2024-01-01", None))
+    assert source.reads == 1
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+
+    def ping(self, reconnect):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+def test_closed_pool_closes_returned_connections(monkeypatch):
+    monkeypatch.setattr(generator_db, "connect", lambda *args: FakeConnection())
+    pool = ConnectionPool("localhost", 3306, "root", "", "test", max_size=1)
+    with pool.connection() as conn:
+        pool.close()
+    assert conn.closed
+    with pytest.raises(RuntimeError):
+        with pool.connection():
+            pass
+
+
+def test_pool_reuses_connections(monkeypatch):
+    monkeypatch.setattr(generator_db, "connect", lambda *args: FakeConnection())
+    pool = ConnectionPool("localhost", 3306, "root", "", "test")
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        pass
+    assert first is second and not first.closed
@@ -0,0 +1,120 @@
+import pytest
+
+from generator_core import DEFAULT_TEMPLATES, DEFAULT_TYPE_MAP, CodeGenerator, Configuration, TemplateSet
+
+COLUMNS = [
+    {"name": "id", "type": "bigint(20)", "comment": ""},
+    {"name": "user_name", "type": "varchar(32)", "comment": "用户名"},
+]
+
+
+def make_generator(templates=None):
+    config = Configuration.default_config()
+    config.generate_config.entity_package = "com.demo.po"
+    config.generate_config.dao_package = "com.demo.dao"
+    config.generate_config.templates = templates
+    return CodeGenerator(config)
+
+
+def paths(files):
+    return [path.as_posix() for path, _ in files]
+
+
+def test_default_templates():
+    files = make_generator().render_files("user_info", COLUMNS)
+    assert paths(files) == [
+        "java/com/demo/po/UserInfo.java",
+        "java/com/demo/dao/UserInfoMapper.java",
+        "resources/mappers/UserInfoMapper.xml",
+    ]
+    assert "private Long id;" in files[0][1]
+
+
+def test_condition_skips_and_stats():
+    templates = DEFAULT_TEMPLATES + [
+        {"template": "Dao.java.j2", "output": "java/{package_path}/{entity_name}Dto.java",
+         "package": "com.demo.dto", "condition": "table.startswith('user')"},
+    ]
+    generator = make_generator(templates)
+    assert "java/com/demo/dto/UserInfoDto.java" in paths(generator.render_files("user_info", COLUMNS))
+    assert len(generator.render_files("order_item", COLUMNS)) == 3
+
+    report = generator.template_report()
+    assert len(report) == 4
+    dto = next(stat for stat in report if stat.output.endswith("Dto.java"))
+    assert (dto.template, dto.renders, dto.skipped) == ("Dao.java.j2", 1, 1)
+    # 与 Mapper 接口共用同一个模板，但统计按清单项分开
+    mapper = next(stat for stat in report if stat.output.endswith("Mapper.java"))
+    assert (mapper.renders, mapper.skipped) == (2, 0)
+    assert mapper.bytes > 0 and mapper.seconds > 0
+    assert report == sorted(report, key=lambda stat: stat.seconds, reverse=True)
+
+
+@pytest.mark.parametrize("templates", [
+    [{"template": "Dao.java.j2"}],
+    [{"template": "Dao.java.j2", "output": "a", "unknown": 1}],
+    [{"template": "Dao.java.j2", "output": "java/{nope}/A.java"}],
+    [{"template": "Dao.java.j2", "output": "java/{table.__class__}/A.java"}],
+    [{"template": "Dao.java.j2", "output": "java/{package_path}/A.java"}],
+    [{"template": "Dao.java.j2", "output": "a/{table}"}, {"template": "Entity.java.j2", "output": "a/{table}"}],
+    [{"template": "Missing.java.j2", "output": "a/{table}"}],
+    [{"template": "Dao.java.j2", "output": "a/{table}", "condition": "table =="}],
+    [{"template": "Dao.java.j2", "output": "/tmp/evil/{entity_name}.java"}],
+    [{"template": "Dao.java.j2", "output": "../../up/{table}"}],
+    [{"template": "Dao.java.j2", "output": "C:\\evil\\{table}"}],
+    [{"template": "Dao.java.j2", "output": "{table:>20}x"}],
+    [{"template": "Dao.java.j2", "output": "{table!r}"}],
+    [{"template": "Dao.java.j2", "output": "{table"}],
+])
+def test_invalid_manifest(templates):
+    with pytest.raises(ValueError):
+        TemplateSet(templates, DEFAULT_TYPE_MAP)
+
+
+def test_duplicate_output_at_render_time():
+    # 路径模板不同，但实体包与接口包相同时会得到同一路径
+    generator = make_generator([
+        {"template": "Dao.java.j2", "output": "{dao_path}/{entity_name}"},
+        {"template": "Entity.java.j2", "output": "{entity_path}/{entity_name}"},
+    ])
+    generator.config.generate_config.entity_package = "com.demo.dao"
+    with pytest.raises(ValueError):
+        generator.render_files("user_info", COLUMNS)
+
+
+def test_condition_is_sandboxed():
+    generator = make_generator([
+        {"template": "Dao.java.j2", "output": "a/{table}",
+         "condition": "().__class__.__base__.__subclasses__()|length > 0"},
+    ])
+    with pytest.raises(ValueError):
+        generator.render_files("user_info", COLUMNS)
+
+
+def test_duplicate_output_across_tables():
+    generator = make_generator([{"template": "Dao.java.j2", "output": "x.java"}])
+    generator.render_files("user_info", COLUMNS)
+    with pytest.raises(ValueError):
+        generator.render_files("order_item", COLUMNS)
+
+
+def test_resolved_path_must_stay_relative():
+    generator = make_generator()
+    generator.config.generate_config.xml_path = "../../outside"
+    with pytest.raises(ValueError):
+        generator.render_files("user_info", COLUMNS)
+
+
+@pytest.mark.parametrize("condition", ["1/0", "table + 1"])
+def test_condition_errors_become_value_error(condition):
+    generator = make_generator([{"template": "Dao.java.j2", "output": "a/{table}", "condition": condition}])
+    with pytest.raises(ValueError, match="Dao.java.j2"):
+        generator.render_files("user_info", COLUMNS)
+
+
+def test_generate_code_writes_under_output_path(tmp_path):
+    generator = make_generator()
+    generator.config.output_path = str(tmp_path)
+    generator.config.output_mode = "write_into_path"
+    generator.generate_code("user_info", COLUMNS)
+    assert (tmp_path / "java/com/demo/po/UserInfo.java").is_file()